@@ -1,9 +1,16 @@
 import asyncio
-from datetime import datetime, timedelta
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import tempfile
+import time
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, UploadFile, File
-from typing import List
+from typing import Deque, Dict, List, Optional
+from pydantic import TypeAdapter
 
 from ..models.auth import User
+from ..models.test_cases import LLMTestCaseRequest
 from ..models.evaluation import (
     EvaluationRequest,
     BulkEvaluationRequest,
@@ -14,24 +21,54 @@ from ..models.evaluation import (
 )
 from ..services.deepeval_service import DeepEvalService
 from ..services.job_service import JobService
+from ..services.batcher import AsyncBatcher
+from ..services.eval_cache import EvalCache
 from ..config import settings
+from ..auth import get_current_user
 
 router = APIRouter(prefix="/evaluate", tags=["Evaluation"])
 deepeval_service = DeepEvalService()
 job_service = JobService()
+# Reuses results for identical (test case, metrics) pairs across requests
+eval_cache = EvalCache(
+    deepeval_service,
+    maxsize=settings.eval_cache_size,
+    ttl=settings.eval_cache_ttl
+)
+# Merges concurrent single evaluations into shared bulk calls
+batcher = AsyncBatcher(eval_cache.evaluate_results, max_batch=16, max_wait_ms=25)
+# Validates parsed dataset rows in one pass
+_TC_ADAPTER = TypeAdapter(List[LLMTestCaseRequest])
+# Worker processes for parsing uploaded dataset files, shut down with the app
+_parse_pool: Optional[ProcessPoolExecutor] = None
+# Test cases evaluated, and dataset rows read, per step
+_DATASET_CHUNK_SIZE = 1024
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the dataset parsing pool, creating it on first use."""
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2))
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the dataset parsing workers."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(cancel_futures=True)
+        _parse_pool = None
 
 
 @router.post("/", response_model=EvaluationResponse)
-async def evaluate_single(request: EvaluationRequest):
+async def evaluate_single(
+    request: EvaluationRequest,
+    current_user: User = Depends(get_current_user)
+):
     """Evaluate a single test case synchronously."""
-    from ..auth import get_current_user
-    current_user = await get_current_user()
-    
     try:
-        result = await deepeval_service.evaluate_single(
-            request.test_case,
-            request.metrics
-        )
+        result = await batcher.submit((request.test_case, request.metrics))
         
         return EvaluationResponse(result=result)
     
@@ -43,13 +80,13 @@ async def evaluate_single(request: EvaluationRequest):
 
 
 @router.post("/bulk", response_model=BulkEvaluationResponse)
-async def evaluate_bulk(request: BulkEvaluationRequest):
+async def evaluate_bulk(
+    request: BulkEvaluationRequest,
+    current_user: User = Depends(get_current_user)
+):
     """Evaluate multiple test cases synchronously."""
-    from ..auth import get_current_user
-    current_user = await get_current_user()
-    
     try:
-        evaluation_data = await deepeval_service.evaluate_bulk(
+        evaluation_data = await eval_cache.evaluate_bulk(
             request.test_cases,
             request.metrics,
             max_concurrent=request.max_concurrent or settings.default_max_concurrent
@@ -70,14 +107,12 @@ async def evaluate_bulk(request: BulkEvaluationRequest):
 @router.post("/async", response_model=AsyncEvaluationResponse)
 async def evaluate_async(
     request: EvaluationRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user)
 ):
     """Start an asynchronous evaluation job for a single test case."""
-    from ..auth import get_current_user
-    current_user = await get_current_user()
-    
     # Create job
-    job_id = await job_service.create_job(
+    job = await job_service.create_job(
         job_name=request.job_name,
         tags=request.tags,
         metadata={"user": current_user.username, "type": "single"}
@@ -86,29 +121,26 @@ async def evaluate_async(
     # Start background task
     background_tasks.add_task(
         _run_async_single_evaluation,
-        job_id,
+        job.job_id,
         request
     )
     
-    job = await job_service.get_job(job_id)
     return AsyncEvaluationResponse(
-        job_id=job_id,
+        job_id=job.job_id,
         status="pending",
-        created_at=job.created_at if job else datetime.now()
+        created_at=job.created_at
     )
 
 
 @router.post("/async/bulk", response_model=AsyncEvaluationResponse)
 async def evaluate_bulk_async(
     request: BulkEvaluationRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user)
 ):
     """Start an asynchronous evaluation job for multiple test cases."""
-    from ..auth import get_current_user
-    current_user = await get_current_user()
-    
     # Create job
-    job_id = await job_service.create_job(
+    job = await job_service.create_job(
         job_name=request.job_name,
         tags=request.tags,
         metadata={
@@ -121,15 +153,14 @@ async def evaluate_bulk_async(
     # Start background task
     background_tasks.add_task(
         _run_async_bulk_evaluation,
-        job_id,
+        job.job_id,
         request
     )
     
-    job = await job_service.get_job(job_id)
     return AsyncEvaluationResponse(
-        job_id=job_id,
+        job_id=job.job_id,
         status="pending",
-        created_at=job.created_at if job else datetime.now()
+        created_at=job.created_at
     )
 
 
@@ -137,12 +168,10 @@ async def evaluate_bulk_async(
 async def evaluate_dataset(
     request: DatasetEvaluationRequest,
     background_tasks: BackgroundTasks,
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user)
 ):
     """Evaluate a dataset from uploaded file."""
-    from ..auth import get_current_user
-    current_user = await get_current_user()
-    
     # Validate file size
     if file.size > settings.max_file_size:
         raise HTTPException(
@@ -151,7 +180,7 @@ async def evaluate_dataset(
         )
     
     # Create job
-    job_id = await job_service.create_job(
+    job = await job_service.create_job(
         job_name=request.job_name or f"Dataset: {request.dataset_name}",
         tags=request.tags,
         metadata={
@@ -165,16 +194,15 @@ async def evaluate_dataset(
     # Start background task
     background_tasks.add_task(
         _run_async_dataset_evaluation,
-        job_id,
+        job.job_id,
         request,
         file
     )
     
-    job = await job_service.get_job(job_id)
     return AsyncEvaluationResponse(
-        job_id=job_id,
+        job_id=job.job_id,
         status="pending",
-        created_at=job.created_at if job else datetime.now()
+        created_at=job.created_at
     )
 
 
@@ -184,22 +212,19 @@ async def _run_async_single_evaluation(job_id: str, request: EvaluationRequest):
         await job_service.update_job_status(job_id, "running")
         await job_service.update_job_progress(job_id, 0, 1, "Starting evaluation...")
         
-        result = await deepeval_service.evaluate_single(
+        result = await eval_cache.evaluate_single(
             request.test_case,
             request.metrics
         )
         
+        # The cache reports a failed evaluation as an error result; fail the job instead
+        error = deepeval_service._evaluation_error(result)
+        if error is not None:
+            raise RuntimeError(error)
+        
         await job_service.update_job_progress(job_id, 1, 1, "Evaluation completed")
         
-        # Create summary for single result
-        from ..models.evaluation import EvaluationSummary
-        summary = EvaluationSummary(
-            total_test_cases=1,
-            successful_test_cases=1 if result.overall_success else 0,
-            failed_test_cases=0 if result.overall_success else 1,
-            success_rate=1.0 if result.overall_success else 0.0,
-            total_execution_time=result.execution_time,
-        )
+        summary = deepeval_service._calculate_summary([result], result.execution_time)
         
         await job_service.complete_job(job_id, [result], summary)
     
@@ -209,41 +234,164 @@ async def _run_async_single_evaluation(job_id: str, request: EvaluationRequest):
 
 async def _run_async_bulk_evaluation(job_id: str, request: BulkEvaluationRequest):
     """Background task for bulk evaluation."""
+    tasks = []
     try:
         await job_service.update_job_status(job_id, "running")
         total_tests = len(request.test_cases)
         await job_service.update_job_progress(job_id, 0, total_tests, "Starting bulk evaluation...")
         
-        # Process in batches to provide progress updates
-        batch_size = min(request.max_concurrent or 10, 10)
-        results = []
+        # Start small and grow towards max_concurrent while latency allows
+        limiter = _AdaptiveLimiter(
+            request.max_concurrent or settings.default_max_concurrent,
+            settings.bulk_latency_target
+        )
         
-        for i in range(0, total_tests, batch_size):
-            batch = request.test_cases[i:i + batch_size]
-            
-            # Evaluate batch
-            batch_data = await deepeval_service.evaluate_bulk(
-                batch,
-                request.metrics,
-                max_concurrent=batch_size
-            )
-            
-            results.extend(batch_data["results"])
+        async def run_one(idx, test_case):
+            await limiter.acquire()
+            started = time.monotonic()
+            try:
+                return idx, await eval_cache.evaluate_single(test_case, request.metrics)
+            except Exception as e:
+                return idx, deepeval_service._create_error_result(test_case, e)
+            finally:
+                await limiter.release(time.monotonic() - started)
+        
+        # Schedule the cheapest test cases first (shortest job first), but
+        # keep a slot per original index so results come back in input order
+        sizes = [_estimate_test_case_size(tc) for tc in request.test_cases]
+        order = sorted(range(total_tests), key=sizes.__getitem__)
+        results = [None] * total_tests
+        
+        start_time = time.time()
+        tasks = [asyncio.ensure_future(run_one(idx, request.test_cases[idx])) for idx in order]
+        
+        progress = _ProgressThrottler(total_tests)
+        completed = 0
+        
+        for next_result in asyncio.as_completed(tasks):
+            idx, result = await next_result
+            results[idx] = result
+            completed += 1
             
-            # Update progress
-            completed = min(i + batch_size, total_tests)
-            await job_service.update_job_progress(
-                job_id, completed, total_tests, 
-                f"Processed {completed}/{total_tests} test cases"
-            )
+            if progress.should_emit(completed):
+                await job_service.update_job_progress(
+                    job_id, completed, total_tests, 
+                    f"Processed {completed}/{total_tests} test cases"
+                )
         
         # Calculate final summary
-        final_summary = deepeval_service._calculate_summary(results, 0)
+        final_summary = deepeval_service._calculate_summary(results, time.time() - start_time)
         
+        await job_service.update_job_metadata(job_id, concurrency_history=limiter.history)
         await job_service.complete_job(job_id, results, final_summary)
     
     except Exception as e:
         await job_service.fail_job(job_id, str(e))
+    
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class _ProgressThrottler:
+    """Limit job progress writes to one per percent or per interval."""
+    
+    def __init__(self, total: int, interval: float = 0.25):
+        self.total = total
+        self.interval = interval
+        self.last_emit_ts = time.monotonic()
+        self.last_emit_pct = 0
+    
+    def should_emit(self, completed: int) -> bool:
+        """Check whether this progress update should be written."""
+        now = time.monotonic()
+        pct = completed * 100 // self.total if self.total > 0 else 100
+        
+        # The final update is never dropped
+        if completed >= self.total or pct > self.last_emit_pct or now - self.last_emit_ts > self.interval:
+            self.last_emit_ts = now
+            self.last_emit_pct = pct
+            return True
+        return False
+
+
+class _AdaptiveLimiter:
+    """Concurrency limit that doubles while latency is on target and halves when it isn't."""
+    
+    def __init__(self, max_limit: int, target_latency: float, alpha: float = 0.3):
+        self.max_limit = max(1, max_limit)
+        self.limit = min(2, self.max_limit)
+        self.target_latency = target_latency
+        self.alpha = alpha
+        self.latency_ema = None
+        self.history = [self.limit]
+        self._in_flight = 0
+        self._since_adjust = 0
+        # FIFO of waiting acquirers, woken one per free slot
+        self._waiters: Deque[asyncio.Future] = deque()
+    
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            return
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation; pass it on
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+    
+    async def release(self, latency: float) -> None:
+        """Free a slot and fold its latency into the running average."""
+        self._in_flight -= 1
+        if self.latency_ema is None:
+            self.latency_ema = latency
+        else:
+            self.latency_ema = self.alpha * latency + (1 - self.alpha) * self.latency_ema
+        
+        # Re-tune once a full round at the current limit has finished
+        self._since_adjust += 1
+        if self._since_adjust >= self.limit:
+            self._since_adjust = 0
+            if self.latency_ema < self.target_latency:
+                new_limit = min(self.limit * 2, self.max_limit)
+            else:
+                new_limit = max(1, self.limit // 2)
+            
+            if new_limit != self.limit:
+                self.limit = new_limit
+                self.history.append(new_limit)
+        
+        self._wake()
+    
+    def _wake(self) -> None:
+        """Hand free slots to waiters in arrival order."""
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
+# Test case fields read from uploaded dataset files
+_DATASET_FIELDS = ["input", "actual_output", "expected_output", "retrieval_context", "context"]
+
+
+def _estimate_test_case_size(test_case) -> int:
+    """Estimate evaluation cost of a test case from its text length."""
+    size = len(str(getattr(test_case, "input", "") or ""))
+    size += len(getattr(test_case, "actual_output", "") or "")
+    size += sum(len(c) for c in getattr(test_case, "retrieval_context", None) or [])
+    size += sum(len(turn["content"]) for turn in getattr(test_case, "turns", None) or [])
+    return size
 
 
 async def _run_async_dataset_evaluation(
@@ -252,46 +400,78 @@ async def _run_async_dataset_evaluation(
     file: UploadFile
 ):
     """Background task for dataset evaluation."""
+    path = None
     try:
         await job_service.update_job_status(job_id, "running")
         await job_service.update_job_progress(job_id, 0, 100, "Processing dataset file...")
         
-        # Read and parse file
-        content = await file.read()
-        test_cases = await _parse_dataset_file(content, file.filename, request)
+        # Stream the upload to disk instead of reading it into memory
+        with tempfile.NamedTemporaryFile(delete=False) as tmp:
+            path = tmp.name
+            while chunk := await file.read(1 << 20):
+                tmp.write(chunk)
         
-        total_tests = len(test_cases)
-        await job_service.update_job_progress(
-            job_id, 10, 100, f"Parsed {total_tests} test cases. Starting evaluation..."
-        )
+        test_cases = await _parse_dataset_file(path, file.filename, request)
         
-        # Run evaluation
-        evaluation_data = await deepeval_service.evaluate_bulk(
-            test_cases,
-            request.metrics,
-            max_concurrent=request.max_concurrent or settings.default_max_concurrent
-        )
+        await job_service.update_job_progress(job_id, 10, 100, "Starting evaluation...")
+        
+        # Evaluate the dataset chunk by chunk
+        start_time = time.time()
+        results = []
+        for i in range(0, len(test_cases), _DATASET_CHUNK_SIZE):
+            results.extend(await eval_cache.evaluate_results(
+                test_cases[i:i + _DATASET_CHUNK_SIZE],
+                request.metrics,
+                max_concurrent=request.max_concurrent or settings.default_max_concurrent
+            ))
+            
+            # Evaluation spans 10-90% of the job
+            await job_service.update_job_progress(
+                job_id, 10 + 80 * len(results) // len(test_cases), 100,
+                f"Evaluated {len(results)} test cases..."
+            )
         
         await job_service.update_job_progress(job_id, 90, 100, "Finalizing results...")
         
-        await job_service.complete_job(
-            job_id,
-            evaluation_data["results"],
-            evaluation_data["summary"]
-        )
+        summary = deepeval_service._calculate_summary(results, time.time() - start_time)
+        await job_service.complete_job(job_id, results, summary)
     
     except Exception as e:
         await job_service.fail_job(job_id, str(e))
+    
+    finally:
+        if path:
+            os.unlink(path)
 
 
-async def _parse_dataset_file(content: bytes, filename: str, request: DatasetEvaluationRequest) -> List:
+async def _parse_dataset_file(path: str, filename: str, request: DatasetEvaluationRequest) -> List:
     """Parse dataset file into test cases."""
+    # Parsing is CPU bound, so keep it off the event loop
+    loop = asyncio.get_running_loop()
+    records = await loop.run_in_executor(
+        _get_parse_pool(),
+        _parse_blocking,
+        path,
+        filename,
+        request.column_mapping or {},
+        request.file_format,
+        _DATASET_CHUNK_SIZE
+    )
+    
+    return _TC_ADAPTER.validate_python(records)
+
+
+def _parse_blocking(
+    path: str,
+    filename: str,
+    column_mapping: Dict[str, str],
+    file_format: str,
+    chunk_size: int
+) -> List[Dict]:
+    """Parse dataset file into test case records. Runs in a worker process."""
     import pandas as pd
-    import json
-    from io import StringIO, BytesIO
     
     # Determine file format
-    file_format = request.file_format
     if file_format == "auto":
         if filename.endswith('.csv'):
             file_format = "csv"
@@ -302,46 +482,62 @@ async def _parse_dataset_file(content: bytes, filename: str, request: DatasetEva
     
     # Parse file
     if file_format == "csv":
-        df = pd.read_csv(StringIO(content.decode('utf-8')))
-        data = df.to_dict('records')
+        # The C parser decodes straight from the file's bytes
+        reader = pd.read_csv(path, chunksize=chunk_size, encoding='utf-8')
     elif file_format == "json":
-        content_str = content.decode('utf-8')
         if filename.endswith('.jsonl'):
             # JSON Lines format
-            data = [json.loads(line) for line in content_str.strip().split('\n')]
+            reader = _iter_jsonl_frames(path, chunk_size)
         else:
-            # Regular JSON
-            data = json.loads(content_str)
+            # Regular JSON can't be read incrementally, so slice it instead
+            with open(path, 'rb') as f:
+                data = orjson.loads(f.read())
             if not isinstance(data, list):
                 data = [data]
+            df = pd.json_normalize(data, max_level=0)
+            reader = (df.iloc[i:i + chunk_size] for i in range(0, len(df), chunk_size))
     else:
         raise ValueError(f"Unsupported file format: {file_format}")
     
-    # Convert to test cases
-    from ..models.test_cases import LLMTestCaseRequest
-    test_cases = []
+    records = []
+    try:
+        for frame in reader:
+            records.extend(_dataframe_to_records(frame, column_mapping))
+    finally:
+        reader.close()
+    return records
+
+
+def _iter_jsonl_frames(path: str, chunk_size: int):
+    """Decode a JSON Lines file with orjson, yielding frames of chunk_size rows."""
+    import pandas as pd
     
-    column_mapping = request.column_mapping or {}
+    with open(path, 'rb') as f:
+        rows = []
+        for line in f:
+            if line.strip():
+                rows.append(orjson.loads(line))
+            if len(rows) == chunk_size:
+                yield pd.DataFrame(rows)
+                rows = []
+        if rows:
+            yield pd.DataFrame(rows)
+
+
+def _dataframe_to_records(df, column_mapping: Dict[str, str]) -> List[Dict]:
+    """Convert a parsed dataset frame into test case records."""
+    import pandas as pd
     
-    for row in data:
-        # Map columns to test case fields
-        mapped_row = {}
-        for field, column in column_mapping.items():
-            if column in row:
-                mapped_row[field] = row[column]
-        
-        # Use direct field names if no mapping provided
-        if not column_mapping:
-            mapped_row = row
-        
-        # Create test case
-        test_case = LLMTestCaseRequest(
-            input=mapped_row.get('input', ''),
-            actual_output=mapped_row.get('actual_output', ''),
-            expected_output=mapped_row.get('expected_output'),
-            retrieval_context=mapped_row.get('retrieval_context'),
-            context=mapped_row.get('context'),
+    # Map columns to test case fields, or use direct field names if no mapping provided
+    if column_mapping:
+        df = pd.DataFrame(
+            {field: df[column] if column in df else None for field, column in column_mapping.items()},
+            index=df.index
         )
-        test_cases.append(test_case)
     
-    return test_cases
+    # Keep only test case fields; missing columns become empty values
+    df = df.reindex(columns=_DATASET_FIELDS)
+    df = df.astype(object).where(pd.notna(df), None)
+    df[["input", "actual_output"]] = df[["input", "actual_output"]].fillna("")
+    
+    return df.to_dict('records')
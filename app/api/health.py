@@ -1,3 +1,4 @@
+import time
 from datetime import datetime
 from fastapi import APIRouter, Depends
 from typing import Optional
@@ -6,17 +7,31 @@ from ..models.health import HealthResponse
 from ..models.auth import User
 from ..services.deepeval_service import DeepEvalService
 from ..config import settings
+from ..auth import get_current_user
 
 router = APIRouter(prefix="/health", tags=["Health"])
 deepeval_service = DeepEvalService()
 
+# Library availability and provider keys don't change while the process runs
+_health_data = deepeval_service.health_check()
+_STATIC_HEALTH = {
+    "version": settings.version,
+    "deepeval_available": _health_data["deepeval_available"],
+    "openai_configured": _health_data["openai_configured"],
+    "anthropic_configured": _health_data.get("anthropic_configured"),
+    "google_configured": _health_data.get("google_configured"),
+    "system_info": {
+        "supported_metrics": _health_data["supported_metrics"],
+        "deepeval_version": _health_data.get("deepeval_version"),
+    },
+}
+_STARTED_AT = time.monotonic()
+
 
 @router.get("/", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint - no authentication required."""
     try:
-        health_data = deepeval_service.health_check()
-        
         # Check Redis availability (if configured)
         redis_available = None
         if settings.use_redis and settings.redis_url:
@@ -33,7 +48,7 @@ async def health_check():
         status = "healthy"
         errors = []
         
-        if not health_data["deepeval_available"]:
+        if not _STATIC_HEALTH["deepeval_available"]:
             status = "unhealthy"
             errors.append("DeepEval library not available")
         
@@ -41,19 +56,12 @@ async def health_check():
             status = "degraded" if status == "healthy" else status
             errors.append("Redis not available")
         
-        return HealthResponse(
+        return HealthResponse.model_construct(
+            **_STATIC_HEALTH,
             status=status,
-            version=settings.version,
-            timestamp=datetime.now().isoformat(),
-            deepeval_available=health_data["deepeval_available"],
+            timestamp=datetime.now(),
             redis_available=redis_available,
-            openai_configured=health_data["openai_configured"],
-            anthropic_configured=health_data.get("anthropic_configured"),
-            google_configured=health_data.get("google_configured"),
-            system_info={
-                "supported_metrics": health_data["supported_metrics"],
-                "deepeval_version": health_data.get("deepeval_version"),
-            },
+            uptime=time.monotonic() - _STARTED_AT,
             errors=errors if errors else None,
         )
     
@@ -61,7 +69,7 @@ async def health_check():
         return HealthResponse(
             status="unhealthy",
             version=settings.version,
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now(),
             deepeval_available=False,
             openai_configured=False,
             errors=[f"Health check failed: {str(e)}"]
@@ -69,11 +77,8 @@ async def health_check():
 
 
 @router.get("/detailed")
-async def detailed_health_check():
+async def detailed_health_check(current_user: User = Depends(get_current_user)):
     """Detailed health check - requires authentication."""
-    from ..auth import get_current_user
-    current_user = await get_current_user()
-    
     health_data = deepeval_service.health_check()
     
     return {
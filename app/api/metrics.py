@@ -13,21 +13,26 @@ deepeval_service = DeepEvalService()
 @router.get("/", response_model=List[Dict[str, Any]])
 async def list_available_metrics(current_user: User = Depends(get_current_user)):
     """List all available metrics."""
-    metrics = deepeval_service.list_available_metrics()
-    
-    # Remove non-serializable class objects
-    serializable_metrics = []
-    for metric in metrics:
-        serializable_metric = {k: v for k, v in metric.items() if k != "class"}
-        serializable_metrics.append(serializable_metric)
-    
-    return serializable_metrics
+    return list(_METRICS_SERIALIZED)
 
 
 @router.get("/categories")
 async def list_metric_categories(current_user: User = Depends(get_current_user)):
     """List metric categories."""
-    metrics = deepeval_service.list_available_metrics()
+    return _CATEGORIES_CACHED
+
+
+@router.get("/{metric_type}")
+async def get_metric_info(metric_type: MetricType, current_user: User = Depends(get_current_user)):
+    """Get detailed information about a specific metric."""
+    info = _METRIC_INFO_BY_TYPE.get(metric_type)
+    if info is None:
+        raise HTTPException(status_code=404, detail=f"Unknown metric type: {metric_type}")
+    return info
+
+
+def _build_categories(metrics) -> Dict[str, Dict[str, Any]]:
+    """Group metrics by category."""
     categories = {}
     
     for metric in metrics:
@@ -48,22 +53,6 @@ async def list_metric_categories(current_user: User = Depends(get_current_user))
     return categories
 
 
-@router.get("/{metric_type}")
-async def get_metric_info(metric_type: MetricType, current_user: User = Depends(get_current_user)):
-    """Get detailed information about a specific metric."""
-    try:
-        info = deepeval_service.get_metric_info(metric_type)
-        # Remove non-serializable class object
-        serializable_info = {k: v for k, v in info.items() if k != "class"}
-        return {
-            **serializable_info,
-            "description": _get_metric_description(metric_type),
-            "example_usage": _get_metric_example(metric_type),
-        }
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-
 def _get_category_description(category: str) -> str:
     """Get description for metric category."""
     descriptions = {
@@ -132,3 +121,20 @@ def _get_metric_example(metric_type: MetricType) -> Dict[str, Any]:
         "test_case": {"input": "Sample input", "actual_output": "Sample output"},
         "metric_config": {"metric_type": metric_type.value, "threshold": 0.5}
     })
+
+
+# The metric catalog is static per process, so serialize it once at import.
+# Non-serializable class objects are removed.
+_METRICS_SERIALIZED = tuple(
+    {k: v for k, v in metric.items() if k != "class"}
+    for metric in deepeval_service.list_available_metrics()
+)
+_CATEGORIES_CACHED = _build_categories(_METRICS_SERIALIZED)
+_METRIC_INFO_BY_TYPE: Dict[MetricType, Dict[str, Any]] = {
+    metric["metric_type"]: {
+        **metric,
+        "description": _get_metric_description(metric["metric_type"]),
+        "example_usage": _get_metric_example(metric["metric_type"]),
+    }
+    for metric in _METRICS_SERIALIZED
+}
@@ -10,36 +10,31 @@ auth_service = AuthService()
 security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user_from_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> Optional[User]:
-    """Get current user from JWT token."""
+def _resolve_user(
+    credentials: Optional[HTTPAuthorizationCredentials],
+    x_api_key: Optional[str]
+) -> Optional[User]:
+    """Resolve the user from an API key or, failing that, a JWT token."""
+    # API keys are a set lookup, so check them before verifying any JWT
+    if x_api_key and auth_service.validate_api_key(x_api_key):
+        return auth_service.get_api_user()
+    
     if not credentials:
         return None
     
     try:
         token_data = auth_service.verify_token(credentials.credentials)
-        user = auth_service.get_user_by_token(token_data)
-        return user
+        return auth_service.get_user_by_token(token_data)
     except HTTPException:
         return None
 
 
-async def get_current_user_from_api_key(x_api_key: Optional[str] = Header(None, alias="X-API-Key")) -> Optional[User]:
-    """Get current user from API key."""
-    if not x_api_key:
-        return None
-    
-    if auth_service.validate_api_key(x_api_key):
-        return auth_service.get_api_user()
-    
-    return None
-
-
 async def get_current_user(
-    user_from_token: Optional[User] = Depends(get_current_user_from_token),
-    user_from_api_key: Optional[User] = Depends(get_current_user_from_api_key)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    x_api_key: Optional[str] = Header(None, alias="X-API-Key")
 ) -> User:
-    """Get current user from either JWT token or API key."""
-    user = user_from_token or user_from_api_key
+    """Get current user from either API key or JWT token."""
+    user = _resolve_user(credentials, x_api_key)
     
     if not user:
         raise HTTPException(
@@ -63,8 +58,8 @@ async def get_current_admin_user(current_user: User = Depends(get_current_user))
 
 # Optional authentication (doesn't raise error if not authenticated)
 async def get_optional_user(
-    user_from_token: Optional[User] = Depends(get_current_user_from_token),
-    user_from_api_key: Optional[User] = Depends(get_current_user_from_api_key)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    x_api_key: Optional[str] = Header(None, alias="X-API-Key")
 ) -> Optional[User]:
     """Get current user if authenticated, otherwise None."""
-    return user_from_token or user_from_api_key
+    return _resolve_user(credentials, x_api_key)
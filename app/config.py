@@ -1,5 +1,6 @@
 import os
-from typing import Optional, List
+from functools import cached_property
+from typing import FrozenSet, Optional, List
 from pydantic_settings import BaseSettings, SettingsConfigDict # Add this import
 
 class Settings(BaseSettings):
@@ -33,6 +34,11 @@ class Settings(BaseSettings):
         """Get API keys as a list."""
         return [key.strip() for key in self.api_keys.split(",") if key.strip()]
     
+    @cached_property
+    def api_keys_set(self) -> FrozenSet[str]:
+        """Get API keys as a frozenset for O(1) lookups."""
+        return frozenset(self.api_keys_list)
+    
     # DeepEval Configuration
     deepeval_api_key: Optional[str] = os.getenv("DEEPEVAL_API_KEY")
     
@@ -54,6 +60,11 @@ class Settings(BaseSettings):
     default_max_concurrent: int = 10
     default_timeout: int = 300  # 5 minutes
     max_file_size: int = 10 * 1024 * 1024  # 10MB
+    bulk_latency_target: float = 30.0  # Seconds per test case before bulk jobs back off
+    
+    # Result cache for identical test case and metric configurations
+    eval_cache_size: int = 10_000
+    eval_cache_ttl: int = 3600  # 1 hour
     
     # Logging
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
@@ -53,6 +53,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down application")
+    
+    from .api.evaluation import shutdown_parse_pool
+    shutdown_parse_pool()
 
 
 # Create FastAPI app
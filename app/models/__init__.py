@@ -6,10 +6,23 @@ from .test_cases import (
     ToolCall,
     Turn,
     MLLMImage,
+    TestCaseRequest,
 )
 from .metrics import (
     MetricType,
     MetricRequest,
+    BaseMetricRequest,
+    GEvalMetricRequest,
+    FaithfulnessMetricRequest,
+    BiasMetricRequest,
+    ToxicityMetricRequest,
+    ToolCorrectnessMetricRequest,
+    SummarizationMetricRequest,
+    NonAdviceMetricRequest,
+    MisuseMetricRequest,
+    RoleViolationMetricRequest,
+    PromptAlignmentMetricRequest,
+    GenericMetricRequest,
     MetricResult,
     LLMTestCaseParam,
 )
@@ -41,9 +54,22 @@ __all__ = [
     "ToolCall",
     "Turn",
     "MLLMImage",
+    "TestCaseRequest",
     # Metrics
     "MetricType",
     "MetricRequest",
+    "BaseMetricRequest",
+    "GEvalMetricRequest",
+    "FaithfulnessMetricRequest",
+    "BiasMetricRequest",
+    "ToxicityMetricRequest",
+    "ToolCorrectnessMetricRequest",
+    "SummarizationMetricRequest",
+    "NonAdviceMetricRequest",
+    "MisuseMetricRequest",
+    "RoleViolationMetricRequest",
+    "PromptAlignmentMetricRequest",
+    "GenericMetricRequest",
     "MetricResult",
     "LLMTestCaseParam",
     # Evaluation
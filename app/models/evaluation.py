@@ -1,14 +1,9 @@
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel
+from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field
 from datetime import datetime
 from enum import Enum
 
-from .test_cases import (
-    LLMTestCaseRequest,
-    ConversationalTestCaseRequest,
-    MLLMTestCaseRequest,
-    ArenaTestCaseRequest,
-)
+from .test_cases import TestCaseRequest
 from .metrics import MetricRequest, MetricResult
 
 
@@ -23,12 +18,7 @@ class JobStatus(str, Enum):
 
 class TestCaseResult(BaseModel):
     """Result of evaluating a single test case."""
-    test_case: Union[
-        LLMTestCaseRequest,
-        ConversationalTestCaseRequest,
-        MLLMTestCaseRequest,
-        ArenaTestCaseRequest,
-    ]
+    test_case: TestCaseRequest
     metrics: List[MetricResult]
     overall_success: bool
     execution_time: Optional[float] = None  # in seconds
@@ -51,12 +41,7 @@ class EvaluationSummary(BaseModel):
 
 class EvaluationRequest(BaseModel):
     """Request for evaluating a single test case."""
-    test_case: Union[
-        LLMTestCaseRequest,
-        ConversationalTestCaseRequest,
-        MLLMTestCaseRequest,
-        ArenaTestCaseRequest,
-    ]
+    test_case: TestCaseRequest
     metrics: List[MetricRequest]
     
     # Evaluation configuration
@@ -71,12 +56,7 @@ class EvaluationRequest(BaseModel):
 
 class BulkEvaluationRequest(BaseModel):
     """Request for evaluating multiple test cases."""
-    test_cases: List[Union[
-        LLMTestCaseRequest,
-        ConversationalTestCaseRequest,
-        MLLMTestCaseRequest,
-        ArenaTestCaseRequest,
-    ]]
+    test_cases: List[TestCaseRequest]
     metrics: List[MetricRequest]
     
     # Evaluation configuration
@@ -94,7 +74,7 @@ class EvaluationResponse(BaseModel):
     """Response for single test case evaluation."""
     result: TestCaseResult
     execution_time: Optional[float] = None
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
 
 
 class BulkEvaluationResponse(BaseModel):
@@ -102,7 +82,7 @@ class BulkEvaluationResponse(BaseModel):
     results: List[TestCaseResult]
     summary: EvaluationSummary
     execution_time: Optional[float] = None
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
 
 
 class AsyncEvaluationResponse(BaseModel):
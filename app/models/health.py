@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Dict, Any, Optional
 from pydantic import BaseModel
 
@@ -6,7 +7,7 @@ class HealthResponse(BaseModel):
     """Health check response."""
     status: str  # "healthy", "unhealthy", "degraded"
     version: str
-    timestamp: str
+    timestamp: datetime
     
     # Service checks
     deepeval_available: bool
@@ -1,7 +1,11 @@
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from functools import cached_property
+from typing import List, Literal, Optional, Dict, Any, Union, get_args
+from typing_extensions import Annotated
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 from enum import Enum
 
+import orjson
+
 
 class MetricType(str, Enum):
     """All available metric types in DeepEval."""
@@ -64,9 +68,27 @@ class LLMTestCaseParam(str, Enum):
     EXPECTED_TOOLS = "expected_tools"
 
 
-class MetricRequest(BaseModel):
-    """Request for a specific metric evaluation."""
-    metric_type: MetricType
+# Literal twins of the enums above; request models validate these faster
+# than Enum fields, and code converts back with MetricType(...) for dispatch
+MetricTypeLiteral = Literal[tuple(metric_type.value for metric_type in MetricType)]
+LLMTestCaseParamLiteral = Literal[tuple(param.value for param in LLMTestCaseParam)]
+
+_METRIC_TYPE_VALUES = frozenset(get_args(MetricTypeLiteral))
+
+
+def _reject_unknown_metric_type(data: Any) -> Any:
+    """Fail fast on an unknown metric_type before the tagged union lists every tag."""
+    if isinstance(data, dict):
+        metric_type = data.get("metric_type")
+        if isinstance(metric_type, str) and metric_type not in _METRIC_TYPE_VALUES:
+            raise ValueError(f"unknown metric_type: {metric_type!r}")
+    return data
+
+
+class BaseMetricRequest(BaseModel):
+    """Parameters shared by every metric request."""
+    # Frozen so the cache key computed below can never go stale
+    model_config = ConfigDict(frozen=True)
     
     # Common parameters for all metrics
     threshold: Optional[float] = 0.5
@@ -76,48 +98,129 @@ class MetricRequest(BaseModel):
     strict_mode: Optional[bool] = False
     verbose_mode: Optional[bool] = False
     
-    # Metric-specific parameters
+    # Additional custom parameters; values are passed to the metric untouched
+    additional_params: Optional[Dict[str, Any]] = Field(default_factory=dict)
     
-    # For FaithfulnessMetric
-    truths_extraction_limit: Optional[int] = None
+    @cached_property
+    def cache_key(self) -> bytes:
+        """Canonical serialized config, stable across client key ordering."""
+        return orjson.dumps(self.model_dump(mode="json"), option=orjson.OPT_SORT_KEYS)
+    
+    def __hash__(self) -> int:
+        return hash(self.cache_key)
+
+
+class GEvalMetricRequest(BaseMetricRequest):
+    """Request for a G-Eval metric (single-turn, conversational or arena)."""
+    metric_type: Literal["g_eval", "conversational_g_eval", "arena_g_eval"]
     
-    # For G-Eval metrics
     name: Optional[str] = None
     criteria: Optional[str] = None
     evaluation_steps: Optional[List[str]] = None  # Alternative to criteria (mutually exclusive)
-    evaluation_params: Optional[List[LLMTestCaseParam]] = None
+    evaluation_params: Optional[List[LLMTestCaseParamLiteral]] = None
     
     # For G-Eval rubric support
     rubric: Optional[List[Dict[str, Any]]] = None  # List of score ranges and expected outcomes
+
+
+class FaithfulnessMetricRequest(BaseMetricRequest):
+    """Request for FaithfulnessMetric."""
+    metric_type: Literal["faithfulness"]
+    
+    truths_extraction_limit: Optional[int] = None
+
+
+class BiasMetricRequest(BaseMetricRequest):
+    """Request for BiasMetric."""
+    metric_type: Literal["bias"]
     
-    # For BiasMetric
     bias_types: Optional[List[str]] = None  # ["gender", "race", "religion", etc.]
+
+
+class ToxicityMetricRequest(BaseMetricRequest):
+    """Request for ToxicityMetric."""
+    metric_type: Literal["toxicity"]
     
-    # For ToxicityMetric  
     toxicity_categories: Optional[List[str]] = None
+
+
+class ToolCorrectnessMetricRequest(BaseMetricRequest):
+    """Request for ToolCorrectnessMetric."""
+    metric_type: Literal["tool_correctness"]
     
-    # For ToolCorrectnessMetric
     exact_match_tool_names: Optional[bool] = None
     exact_match_input_parameters: Optional[bool] = None
     exact_match_tool_output: Optional[bool] = None
+
+
+class SummarizationMetricRequest(BaseMetricRequest):
+    """Request for SummarizationMetric."""
+    metric_type: Literal["summarization"]
     
-    # For SummarizationMetric
     assessment_questions: Optional[List[str]] = None
+
+
+class NonAdviceMetricRequest(BaseMetricRequest):
+    """Request for NonAdviceMetric."""
+    metric_type: Literal["non_advice"]
     
-    # For NonAdviceMetric
     advice_types: Optional[List[str]] = None  # ["financial", "medical", "legal", etc.]
+
+
+class MisuseMetricRequest(BaseMetricRequest):
+    """Request for MisuseMetric."""
+    metric_type: Literal["misuse"]
     
-    # For MisuseMetric
     domain: Optional[str] = None  # Domain/context for misuse detection
+
+
+class RoleViolationMetricRequest(BaseMetricRequest):
+    """Request for RoleViolationMetric."""
+    metric_type: Literal["role_violation"]
     
-    # For RoleViolationMetric and RoleAdherenceMetric
     role: Optional[str] = None  # Expected role (e.g., "helpful assistant", "customer service agent")
+
+
+class PromptAlignmentMetricRequest(BaseMetricRequest):
+    """Request for PromptAlignmentMetric."""
+    metric_type: Literal["prompt_alignment"]
     
-    # For PromptAlignmentMetric
     prompt_instructions: Optional[str] = None  # Instructions that should be followed (e.g., "Reply in all uppercase")
-    
-    # Additional custom parameters
-    additional_params: Optional[Dict[str, Any]] = {}
+
+
+_SPECIFIC_METRIC_REQUESTS = (
+    GEvalMetricRequest,
+    FaithfulnessMetricRequest,
+    BiasMetricRequest,
+    ToxicityMetricRequest,
+    ToolCorrectnessMetricRequest,
+    SummarizationMetricRequest,
+    NonAdviceMetricRequest,
+    MisuseMetricRequest,
+    RoleViolationMetricRequest,
+    PromptAlignmentMetricRequest,
+)
+_SPECIFIC_METRIC_TYPES = {
+    value
+    for request_class in _SPECIFIC_METRIC_REQUESTS
+    for value in get_args(request_class.model_fields["metric_type"].annotation)
+}
+
+
+class GenericMetricRequest(BaseMetricRequest):
+    """Request for metrics that only take the common parameters."""
+    metric_type: Literal[tuple(
+        metric_type.value for metric_type in MetricType if metric_type.value not in _SPECIFIC_METRIC_TYPES
+    )]
+
+
+# Request for a specific metric evaluation; pydantic dispatches on metric_type
+# and each variant only carries the parameters its metric accepts
+MetricRequest = Annotated[
+    Union[_SPECIFIC_METRIC_REQUESTS + (GenericMetricRequest,)],
+    Field(discriminator="metric_type"),
+    BeforeValidator(_reject_unknown_metric_type),
+]
 
 
 class MetricResult(BaseModel):
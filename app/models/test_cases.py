@@ -1,34 +1,37 @@
 from typing import List, Optional, Dict, Any, Union, Literal
-from pydantic import BaseModel, Field
+from typing_extensions import Annotated, NotRequired, TypedDict
+from pydantic import BaseModel, Discriminator, Field, Tag
 from enum import Enum
 
 
-class ToolCall(BaseModel):
+# Nested test case parts are TypedDicts rather than models: they validate
+# without building an object per item and are read with item["key"]/.get()
+class ToolCall(TypedDict):
     """Tool call representation matching DeepEval's ToolCall structure."""
     name: str
-    description: Optional[str] = None
-    reasoning: Optional[str] = None
-    output: Optional[Any] = None
-    input_parameters: Optional[Dict[str, Any]] = Field(
-        None, serialization_alias="inputParameters"
-    )
+    description: NotRequired[Optional[str]]
+    reasoning: NotRequired[Optional[str]]
+    output: NotRequired[Optional[Any]]
+    input_parameters: NotRequired[Annotated[
+        Optional[Dict[str, Any]], Field(serialization_alias="inputParameters")
+    ]]
 
 
-class Turn(BaseModel):
+class Turn(TypedDict):
     """Conversation turn for multi-turn evaluations."""
     role: Literal["user", "assistant"]
     content: str
-    scenario: Optional[str] = None
-    expected_outcome: Optional[str] = None
-    retrieval_context: Optional[List[str]] = None
-    tools_called: Optional[List[ToolCall]] = None
+    scenario: NotRequired[Optional[str]]
+    expected_outcome: NotRequired[Optional[str]]
+    retrieval_context: NotRequired[Optional[List[str]]]
+    tools_called: NotRequired[Optional[List[ToolCall]]]
 
 
-class MLLMImage(BaseModel):
+class MLLMImage(TypedDict):
     """Multimodal image representation."""
-    type: Literal["image"] = "image"
+    type: NotRequired[Literal["image"]]
     url: str  # Can be local path or URL
-    description: Optional[str] = None
+    description: NotRequired[Optional[str]]
 
 
 class LLMTestCaseRequest(BaseModel):
@@ -96,10 +99,35 @@ class ArenaTestCaseRequest(BaseModel):
     tags: Optional[List[str]] = None
 
 
-# Union type for all test case types
-TestCaseRequest = Union[
-    LLMTestCaseRequest,
-    ConversationalTestCaseRequest, 
-    MLLMTestCaseRequest,
-    ArenaTestCaseRequest
+_TEST_CASE_KINDS = {
+    LLMTestCaseRequest: "llm",
+    ConversationalTestCaseRequest: "conversational",
+    MLLMTestCaseRequest: "mllm",
+    ArenaTestCaseRequest: "arena",
+}
+
+
+def _test_case_kind(value: Any) -> str:
+    """Pick the test case type from the keys that only it has."""
+    if not isinstance(value, dict):
+        return _TEST_CASE_KINDS.get(type(value), "llm")
+    if "turns" in value:
+        return "conversational"
+    if "model_a_output" in value:
+        return "arena"
+    if isinstance(value.get("input"), list):
+        return "mllm"
+    return "llm"
+
+
+# Union type for all test case types, dispatched on shape instead of trying
+# each member in turn
+TestCaseRequest = Annotated[
+    Union[
+        Annotated[LLMTestCaseRequest, Tag("llm")],
+        Annotated[ConversationalTestCaseRequest, Tag("conversational")],
+        Annotated[MLLMTestCaseRequest, Tag("mllm")],
+        Annotated[ArenaTestCaseRequest, Tag("arena")],
+    ],
+    Discriminator(_test_case_kind),
 ]
@@ -1,5 +1,7 @@
 from .deepeval_service import DeepEvalService
-from .job_service import JobService
+from .job_service import JobService, JobHandle
 from .auth_service import AuthService
+from .batcher import AsyncBatcher
+from .eval_cache import EvalCache
 
-__all__ = ["DeepEvalService", "JobService", "AuthService"]
+__all__ = ["DeepEvalService", "JobService", "JobHandle", "AuthService", "AsyncBatcher", "EvalCache"]
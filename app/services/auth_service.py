@@ -1,5 +1,10 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
+from cachetools import LRUCache, TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
@@ -8,27 +13,48 @@ from ..models.auth import User, UserInDB, TokenData
 from ..config import settings
 
 
+_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+@lru_cache(maxsize=1)
+def _hash_admin_password(password: str) -> str:
+    """Hash the configured admin password once per process."""
+    return _pwd_context.hash(password)
+
+
+# Users are fixed by configuration, so build them once as trusted constants
+_USERS_DB: Mapping[str, UserInDB] = MappingProxyType({
+    settings.admin_username: UserInDB.model_construct(
+        username=settings.admin_username,
+        hashed_password=_hash_admin_password(settings.admin_password),
+        full_name="Administrator",
+        scopes=["admin", "user"]
+    )
+})
+
+
 class AuthService:
     """Authentication service for JWT and API key management."""
     
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        self.users_db = self._initialize_users_db()
-    
-    def _initialize_users_db(self) -> Dict[str, UserInDB]:
-        """Initialize the users database."""
-        return {
-            settings.admin_username: UserInDB(
-                username=settings.admin_username,
-                hashed_password=self.get_password_hash(settings.admin_password),
-                full_name="Administrator",
-                scopes=["admin", "user"]
-            )
-        }
+        self.pwd_context = _pwd_context
+        # Successful (password digest, hash) checks, so repeat logins skip bcrypt
+        self._verified: LRUCache = LRUCache(maxsize=128)
+        # Recently verified tokens -> (TokenData, exp), so bursts skip signature checks
+        self._token_cache: TTLCache = TTLCache(maxsize=1024, ttl=5)
+        self.users_db = _USERS_DB
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a plain password against its hash."""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        key = (hashlib.sha256(plain_password.encode()).digest(), hashed_password)
+        if key in self._verified:
+            return True
+        
+        # Failures aren't cached so every wrong guess still pays for bcrypt
+        if self.pwd_context.verify(plain_password, hashed_password):
+            self._verified[key] = True
+            return True
+        return False
     
     def get_password_hash(self, password: str) -> str:
         """Generate password hash."""
@@ -36,7 +62,7 @@ class AuthService:
     
     def get_user(self, username: str) -> Optional[UserInDB]:
         """Get user by username."""
-        return self.users_db.get(username)
+        return _USERS_DB.get(username)
     
     def authenticate_user(self, username: str, password: str) -> Optional[UserInDB]:
         """Authenticate user with username and password."""
@@ -59,6 +85,10 @@ class AuthService:
     
     def verify_token(self, token: str) -> TokenData:
         """Verify and decode JWT token."""
+        cached = self._token_cache.get(token)
+        if cached is not None and cached[1] > time.time():
+            return cached[0]
+        
         try:
             payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
             username: str = payload.get("sub")
@@ -69,6 +99,8 @@ class AuthService:
                     headers={"WWW-Authenticate": "Bearer"},
                 )
             token_data = TokenData(username=username)
+            # Never serve a cached token past its own expiry
+            self._token_cache[token] = (token_data, payload.get("exp", float("inf")))
             return token_data
         except JWTError:
             raise HTTPException(
@@ -79,7 +111,7 @@ class AuthService:
     
     def validate_api_key(self, api_key: str) -> bool:
         """Validate API key against configured keys."""
-        return api_key in settings.api_keys_list
+        return api_key in settings.api_keys_set
     
     def get_user_by_token(self, token_data: TokenData) -> User:
         """Get user by token data."""
@@ -0,0 +1,90 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from ..models import MetricRequest, TestCaseResult
+from .deepeval_service import DeepEvalService
+
+
+class AsyncBatcher:
+    """Coalesce concurrent single evaluations into bulk evaluation calls."""
+
+    def __init__(
+        self,
+        batch_fn: Callable[..., Awaitable[List[TestCaseResult]]],
+        max_batch: int = 16,
+        max_wait_ms: float = 25,
+    ):
+        self._batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        # Created lazily so they bind to the running event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def submit(self, item: Tuple[Any, List[MetricRequest]]) -> TestCaseResult:
+        """Queue a (test_case, metrics) pair and wait for its result."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Drain the queue into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            pending = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            # Collect until the batch is full or the wait window closes
+            while len(pending) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Only requests with identical metric configs can share a bulk call
+            groups: Dict[Tuple[MetricRequest, ...], List] = {}
+            for (test_case, metrics), future in pending:
+                groups.setdefault(tuple(metrics), []).append((test_case, metrics, future))
+
+            # Flush without blocking so the next batch can start filling
+            for group in groups.values():
+                task = asyncio.create_task(self._flush(group))
+                self._flushes.add(task)
+                task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, group: List) -> None:
+        """Evaluate one batch and resolve each caller's future."""
+        test_cases = [test_case for test_case, _, _ in group]
+        metrics = group[0][1]
+
+        try:
+            results = await self._batch_fn(
+                test_cases,
+                metrics,
+                max_concurrent=len(test_cases)
+            )
+        except Exception as e:
+            for _, _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(group, results):
+            if future.done():
+                continue
+            # Bulk evaluation turns a failed test case into an error result;
+            # single submitters get the failure raised instead
+            error = DeepEvalService._evaluation_error(result)
+            if error is not None:
+                future.set_exception(RuntimeError(error))
+            else:
+                future.set_result(result)
@@ -4,6 +4,8 @@ import time
 from typing import List, Dict, Any, Union, Optional
 from datetime import datetime
 
+import numpy as np
+
 # DeepEval imports
 from deepeval import evaluate
 from deepeval.test_case import (
@@ -76,7 +78,6 @@ from ..models import (
     ArenaTestCaseRequest,
     ToolCall,
     Turn,
-    MLLMImage,
     TestCaseResult,
     EvaluationSummary,
     LLMTestCaseParam,
@@ -300,7 +301,7 @@ class DeepEvalService:
     
     def create_metric(self, metric_request: MetricRequest) -> Union[BaseMetric, BaseConversationalMetric, BaseMultimodalMetric, BaseArenaMetric]:
         """Create a DeepEval metric instance from request."""
-        metric_type = metric_request.metric_type
+        metric_type = MetricType(metric_request.metric_type)
         
         if metric_type not in self._metric_registry:
             raise ValueError(f"Unsupported metric type: {metric_type}")
@@ -550,21 +551,21 @@ class DeepEvalService:
         turns = []
         for turn_request in request.turns:
             tools_called = None
-            if turn_request.tools_called:
-                tools_called = [self._convert_tool_call(tool) for tool in turn_request.tools_called]
+            if turn_request.get("tools_called"):
+                tools_called = [self._convert_tool_call(tool) for tool in turn_request["tools_called"]]
             
             # Build turn with only non-None values
             turn_params = {
-                "role": turn_request.role,
-                "content": turn_request.content
+                "role": turn_request["role"],
+                "content": turn_request["content"]
             }
             
-            if turn_request.scenario:
-                turn_params["scenario"] = turn_request.scenario
-            if turn_request.expected_outcome:
-                turn_params["expected_outcome"] = turn_request.expected_outcome
-            if turn_request.retrieval_context:
-                turn_params["retrieval_context"] = turn_request.retrieval_context
+            if turn_request.get("scenario"):
+                turn_params["scenario"] = turn_request["scenario"]
+            if turn_request.get("expected_outcome"):
+                turn_params["expected_outcome"] = turn_request["expected_outcome"]
+            if turn_request.get("retrieval_context"):
+                turn_params["retrieval_context"] = turn_request["retrieval_context"]
             if tools_called:
                 turn_params["tools_called"] = tools_called
                 
@@ -604,8 +605,8 @@ class DeepEvalService:
         for item in request.input:
             if isinstance(item, str):
                 input_items.append(item)
-            elif isinstance(item, MLLMImage):
-                input_items.append(DeepEvalMLLMImage(url=item.url))
+            elif isinstance(item, dict):
+                input_items.append(DeepEvalMLLMImage(url=item["url"]))
             else:
                 input_items.append(str(item))
         
@@ -649,11 +650,11 @@ class DeepEvalService:
     def _convert_tool_call(self, tool: ToolCall) -> DeepEvalToolCall:
         """Convert API ToolCall to DeepEval ToolCall."""
         return DeepEvalToolCall(
-            name=tool.name,
-            description=tool.description,
-            reasoning=tool.reasoning,
-            output=tool.output,
-            input_parameters=tool.input_parameters,
+            name=tool["name"],
+            description=tool.get("description"),
+            reasoning=tool.get("reasoning"),
+            output=tool.get("output"),
+            input_parameters=tool.get("input_parameters"),
         )
     
     async def evaluate_single(
@@ -673,7 +674,7 @@ class DeepEvalService:
                 metric_results.append(result)
             except Exception as e:
                 error_result = MetricResult(
-                    metric_type=metric_request.metric_type.value,
+                    metric_type=metric_request.metric_type,
                     score=0.0,
                     threshold=metric_request.threshold or 0.5,
                     success=False,
@@ -699,7 +700,24 @@ class DeepEvalService:
     ) -> Dict[str, Any]:
         """Evaluate multiple test cases with multiple metrics."""
         start_time = time.time()
+        results = await self.evaluate_results(test_case_requests, metric_requests, max_concurrent)
         
+        # Calculate summary
+        total_execution_time = time.time() - start_time
+        summary = self._calculate_summary(results, total_execution_time)
+        
+        return {
+            "results": results,
+            "summary": summary,
+        }
+    
+    async def evaluate_results(
+        self,
+        test_case_requests: List,
+        metric_requests: List[MetricRequest],
+        max_concurrent: int = 10
+    ) -> List[TestCaseResult]:
+        """Evaluate multiple test cases without building a summary."""
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(max_concurrent)
         
@@ -716,29 +734,32 @@ class DeepEvalService:
         for i, result in enumerate(results):
             if isinstance(result, Exception):
                 # Create error result for failed test case
-                error_result = TestCaseResult(
-                    test_case=test_case_requests[i],
-                    metrics=[MetricResult(
-                        metric_type="error",
-                        score=0.0,
-                        threshold=0.0,
-                        success=False,
-                        error=str(result)
-                    )],
-                    overall_success=False,
-                )
-                valid_results.append(error_result)
+                valid_results.append(self._create_error_result(test_case_requests[i], result))
             else:
                 valid_results.append(result)
         
-        # Calculate summary
-        total_execution_time = time.time() - start_time
-        summary = self._calculate_summary(valid_results, total_execution_time)
-        
-        return {
-            "results": valid_results,
-            "summary": summary,
-        }
+        return valid_results
+    
+    def _create_error_result(self, test_case_request, error: Exception) -> TestCaseResult:
+        """Create a failed result for a test case that could not be evaluated."""
+        return TestCaseResult(
+            test_case=test_case_request,
+            metrics=[MetricResult(
+                metric_type="error",
+                score=0.0,
+                threshold=0.0,
+                success=False,
+                error=str(error)
+            )],
+            overall_success=False,
+        )
+    
+    @staticmethod
+    def _evaluation_error(result: TestCaseResult) -> Optional[str]:
+        """Return the error of a result built by _create_error_result, if it is one."""
+        if len(result.metrics) == 1 and result.metrics[0].metric_type == "error":
+            return result.metrics[0].error
+        return None
     
     async def _evaluate_metric_async(self, metric, test_case) -> MetricResult:
         """Evaluate a single metric asynchronously."""
@@ -782,49 +803,57 @@ class DeepEvalService:
     def _calculate_summary(self, results: List[TestCaseResult], execution_time: float) -> EvaluationSummary:
         """Calculate summary statistics for evaluation results."""
         total_tests = len(results)
-        successful_tests = sum(1 for result in results if result.overall_success)
+        overall = np.fromiter((result.overall_success for result in results), dtype=bool, count=total_tests)
+        successful_tests = int(overall.sum())
         failed_tests = total_tests - successful_tests
         
-        # Calculate per-metric summaries
-        metric_summaries = {}
+        # Flatten metric results into parallel arrays, one group id per metric type
+        metric_index: Dict[str, int] = {}
+        groups, scores, successes, errors = [], [], [], []
         for result in results:
             for metric_result in result.metrics:
-                metric_type = metric_result.metric_type
-                if metric_type not in metric_summaries:
-                    metric_summaries[metric_type] = {
-                        "scores": [],
-                        "successes": 0,
-                        "total": 0,
-                        "errors": 0,
-                    }
-                
-                summary = metric_summaries[metric_type]
-                summary["total"] += 1
-                
-                if metric_result.error:
-                    summary["errors"] += 1
-                else:
-                    summary["scores"].append(metric_result.score)
-                    if metric_result.success:
-                        summary["successes"] += 1
-        
-        # Calculate final metric statistics
-        for metric_type, summary in metric_summaries.items():
-            scores = summary["scores"]
-            if scores:
-                summary["average_score"] = sum(scores) / len(scores)
-                summary["min_score"] = min(scores)
-                summary["max_score"] = max(scores)
-            else:
-                summary["average_score"] = 0.0
-                summary["min_score"] = 0.0
-                summary["max_score"] = 0.0
-            
-            summary["success_rate"] = summary["successes"] / summary["total"] if summary["total"] > 0 else 0.0
-            summary["error_rate"] = summary["errors"] / summary["total"] if summary["total"] > 0 else 0.0
-            
-            # Remove internal tracking fields
-            del summary["scores"]
+                groups.append(metric_index.setdefault(metric_result.metric_type, len(metric_index)))
+                scores.append(metric_result.score)
+                successes.append(metric_result.success)
+                errors.append(bool(metric_result.error))
+        
+        n_metrics = len(metric_index)
+        groups = np.asarray(groups, dtype=np.intp)
+        scores = np.asarray(scores, dtype=np.float64)
+        successes = np.asarray(successes, dtype=bool)
+        errors = np.asarray(errors, dtype=bool)
+        
+        # Scores and successes only count metrics that didn't error
+        scored_groups = groups[~errors]
+        scored = scores[~errors]
+        totals = np.bincount(groups, minlength=n_metrics)
+        error_counts = np.bincount(groups, weights=errors, minlength=n_metrics)
+        success_counts = np.bincount(scored_groups, weights=successes[~errors], minlength=n_metrics)
+        score_counts = np.bincount(scored_groups, minlength=n_metrics)
+        score_sums = np.bincount(scored_groups, weights=scored, minlength=n_metrics)
+        
+        has_scores = score_counts > 0
+        average_scores = np.divide(score_sums, score_counts, out=np.zeros(n_metrics), where=has_scores)
+        min_scores = np.full(n_metrics, np.inf)
+        max_scores = np.full(n_metrics, -np.inf)
+        np.minimum.at(min_scores, scored_groups, scored)
+        np.maximum.at(max_scores, scored_groups, scored)
+        min_scores[~has_scores] = 0.0
+        max_scores[~has_scores] = 0.0
+        
+        metric_summaries = {}
+        for metric_type, i in metric_index.items():
+            metric_summaries[metric_type] = {
+                "successes": int(success_counts[i]),
+                "total": int(totals[i]),
+                "errors": int(error_counts[i]),
+                "average_score": float(average_scores[i]),
+                "min_score": float(min_scores[i]),
+                "max_score": float(max_scores[i]),
+                "std_score": float(scored[scored_groups == i].std()) if has_scores[i] else 0.0,
+                "success_rate": float(success_counts[i] / totals[i]),
+                "error_rate": float(error_counts[i] / totals[i]),
+            }
         
         return EvaluationSummary(
             total_test_cases=total_tests,
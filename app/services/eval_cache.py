@@ -0,0 +1,120 @@
+import asyncio
+import hashlib
+import time
+from typing import Any, Dict, List
+
+import orjson
+from cachetools import TTLCache
+
+from ..models import MetricRequest, TestCaseResult
+from .deepeval_service import DeepEvalService
+
+
+class EvalCache:
+    """Content-addressed cache in front of DeepEvalService evaluations."""
+
+    def __init__(self, deepeval_service: DeepEvalService, maxsize: int = 10_000, ttl: float = 3600):
+        self._service = deepeval_service
+        self._results: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Evaluations currently running, so identical requests share one call
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def _make_key(test_case_request, metrics_blob: bytes) -> str:
+        """Hash a test case together with its serialized metric configs."""
+        digest = hashlib.blake2b(metrics_blob, digest_size=16)
+        digest.update(type(test_case_request).__name__.encode())
+        digest.update(orjson.dumps(
+            test_case_request.model_dump(mode="json"),
+            option=orjson.OPT_SORT_KEYS
+        ))
+        return digest.hexdigest()
+
+    async def evaluate_single(
+        self,
+        test_case_request,
+        metric_requests: List[MetricRequest]
+    ) -> TestCaseResult:
+        """Evaluate a single test case, reusing cached results."""
+        results = await self.evaluate_results([test_case_request], metric_requests, max_concurrent=1)
+        return results[0]
+
+    async def evaluate_bulk(
+        self,
+        test_case_requests: List,
+        metric_requests: List[MetricRequest],
+        max_concurrent: int = 10
+    ) -> Dict[str, Any]:
+        """Evaluate and summarize multiple test cases, reusing cached results."""
+        start_time = time.time()
+        results = await self.evaluate_results(test_case_requests, metric_requests, max_concurrent)
+
+        return {
+            "results": results,
+            "summary": self._service._calculate_summary(results, time.time() - start_time),
+        }
+
+    async def evaluate_results(
+        self,
+        test_case_requests: List,
+        metric_requests: List[MetricRequest],
+        max_concurrent: int = 10
+    ) -> List[TestCaseResult]:
+        """Evaluate multiple test cases, only forwarding cache misses."""
+        loop = asyncio.get_running_loop()
+
+        metrics_blob = b"\n".join(metric.cache_key for metric in metric_requests)
+        keys = [self._make_key(tc, metrics_blob) for tc in test_case_requests]
+
+        results: List[TestCaseResult] = [None] * len(keys)
+        misses: List[int] = []
+        shared: Dict[int, asyncio.Future] = {}
+
+        for idx, key in enumerate(keys):
+            cached = self._results.get(key)
+            if cached is not None:
+                results[idx] = cached
+            elif key in self._in_flight:
+                shared[idx] = self._in_flight[key]
+            else:
+                self._in_flight[key] = loop.create_future()
+                misses.append(idx)
+
+        async def evaluate_misses():
+            if not misses:
+                return
+            miss_results = await self._service.evaluate_results(
+                [test_case_requests[idx] for idx in misses],
+                metric_requests,
+                max_concurrent=max_concurrent
+            )
+
+            for idx, result in zip(misses, miss_results):
+                results[idx] = result
+                self._in_flight[keys[idx]].set_result(result)
+                # Don't keep failures around for the whole TTL
+                if not any(metric.error for metric in result.metrics):
+                    self._results[keys[idx]] = result
+
+        async def await_shared(idx, future):
+            await asyncio.wait([future])
+            if not future.cancelled():
+                results[idx] = future.result()
+            else:
+                results[idx] = await self.evaluate_single(test_case_requests[idx], metric_requests)
+
+        try:
+            await asyncio.gather(
+                evaluate_misses(),
+                *[await_shared(idx, future) for idx, future in shared.items()]
+            )
+        finally:
+            # Release every key this call registered, even if it was cancelled
+            # before evaluate_misses ran; waiters on unresolved keys fall back
+            # to evaluating on their own
+            for idx in misses:
+                future = self._in_flight.pop(keys[idx])
+                if not future.done():
+                    future.cancel()
+
+        return results
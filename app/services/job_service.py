@@ -1,8 +1,9 @@
-import uuid
-import asyncio
-from typing import Dict, List, Optional, Any
+import secrets
+from collections import defaultdict
+from typing import Dict, List, Optional, Any, NamedTuple, Tuple
 from datetime import datetime, timedelta
-import json
+
+from sortedcontainers import SortedList, SortedSet
 
 from ..models.evaluation import (
     JobStatus,
@@ -13,41 +14,93 @@ from ..models.evaluation import (
 )
 
 
+class JobHandle(NamedTuple):
+    """Identifier and creation time of a newly created job."""
+    job_id: str
+    created_at: datetime
+
+
 class JobService:
     """Service for managing asynchronous evaluation jobs."""
     
     def __init__(self, use_redis: bool = False):
-        # In-memory job storage - works great for single server deployments
+        # In-memory job storage - works great for single server deployments.
+        # Only touched from the event loop and never across an await, so no lock.
         self._jobs: Dict[str, Dict[str, Any]] = {}
-        self._job_lock = asyncio.Lock()
         self.use_redis = use_redis
+        
+        # Secondary indices of (created_at, job_id), oldest first
+        self._by_created: SortedList = SortedList()
+        self._by_status: Dict[JobStatus, SortedSet] = defaultdict(SortedSet)
+        self._by_tag: Dict[str, SortedSet] = defaultdict(SortedSet)
+        # (completed_at, job_id) of finished jobs, oldest first, for cleanup
+        self._by_completed: SortedList = SortedList()
+    
+    @staticmethod
+    def _index_key(job: Dict[str, Any]) -> Tuple[datetime, str]:
+        """Sort key shared by all job indices."""
+        return job["created_at"], job["job_id"]
+    
+    def _set_status(self, job: Dict[str, Any], status: JobStatus) -> None:
+        """Change a job's status and move it to the matching status index."""
+        key = self._index_key(job)
+        status = JobStatus(status)
+        self._by_status[job["status"]].discard(key)
+        self._by_status[status].add(key)
+        job["status"] = status
+    
+    def _mark_completed(self, job: Dict[str, Any]) -> None:
+        """Stamp a job's completion time and keep the completion index in step."""
+        if job["completed_at"] is not None:
+            self._by_completed.discard((job["completed_at"], job["job_id"]))
+        job["completed_at"] = datetime.now()
+        self._by_completed.add((job["completed_at"], job["job_id"]))
+    
+    def _remove_job(self, job_id: str) -> None:
+        """Drop a job from storage and every index."""
+        job = self._jobs.pop(job_id)
+        key = self._index_key(job)
+        self._by_created.discard(key)
+        self._by_status[job["status"]].discard(key)
+        if job["completed_at"] is not None:
+            self._by_completed.discard((job["completed_at"], job_id))
+        for tag in job["tags"]:
+            self._by_tag[tag].discard(key)
+            if not self._by_tag[tag]:
+                del self._by_tag[tag]
     
     async def create_job(
         self,
         job_name: Optional[str] = None,
         tags: Optional[List[str]] = None,
         metadata: Optional[Dict[str, Any]] = None
-    ) -> str:
+    ) -> JobHandle:
         """Create a new evaluation job."""
-        job_id = str(uuid.uuid4())
+        job_id = secrets.token_hex(16)
+        created_at = datetime.now()
+        
+        self._jobs[job_id] = {
+            "job_id": job_id,
+            "status": JobStatus.PENDING,
+            "created_at": created_at,
+            "started_at": None,
+            "completed_at": None,
+            "job_name": job_name,
+            "tags": tags or [],
+            "metadata": metadata or {},
+            "results": None,
+            "summary": None,
+            "error": None,
+            "progress": {"current": 0, "total": 0, "percentage": 0.0},
+        }
         
-        async with self._job_lock:
-            self._jobs[job_id] = {
-                "job_id": job_id,
-                "status": JobStatus.PENDING,
-                "created_at": datetime.now(),
-                "started_at": None,
-                "completed_at": None,
-                "job_name": job_name,
-                "tags": tags or [],
-                "metadata": metadata or {},
-                "results": None,
-                "summary": None,
-                "error": None,
-                "progress": {"current": 0, "total": 0, "percentage": 0.0},
-            }
+        key = (created_at, job_id)
+        self._by_created.add(key)
+        self._by_status[JobStatus.PENDING].add(key)
+        for tag in tags or []:
+            self._by_tag[tag].add(key)
         
-        return job_id
+        return JobHandle(job_id, created_at)
     
     async def update_job_status(
         self,
@@ -56,20 +109,19 @@ class JobService:
         error: Optional[str] = None
     ) -> None:
         """Update job status."""
-        async with self._job_lock:
-            if job_id not in self._jobs:
-                raise ValueError(f"Job {job_id} not found")
-            
-            job = self._jobs[job_id]
-            job["status"] = status
-            
-            if status == JobStatus.RUNNING and job["started_at"] is None:
-                job["started_at"] = datetime.now()
-            elif status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
-                job["completed_at"] = datetime.now()
-            
-            if error:
-                job["error"] = error
+        if job_id not in self._jobs:
+            raise ValueError(f"Job {job_id} not found")
+        
+        job = self._jobs[job_id]
+        self._set_status(job, status)
+        
+        if status == JobStatus.RUNNING and job["started_at"] is None:
+            job["started_at"] = datetime.now()
+        elif status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
+            self._mark_completed(job)
+        
+        if error:
+            job["error"] = error
     
     async def update_job_progress(
         self,
@@ -79,20 +131,29 @@ class JobService:
         message: Optional[str] = None
     ) -> None:
         """Update job progress."""
-        async with self._job_lock:
-            if job_id not in self._jobs:
-                return
-            
-            job = self._jobs[job_id]
-            percentage = (current / total * 100) if total > 0 else 0.0
-            
-            job["progress"] = {
-                "current": current,
-                "total": total,
-                "percentage": round(percentage, 2),
-                "message": message,
-                "updated_at": datetime.now().isoformat()
-            }
+        if job_id not in self._jobs:
+            return
+        
+        progress = self._jobs[job_id]["progress"]
+        
+        # Drop sub-percent advances, capping ticks at ~100 per job; a new total,
+        # the final tick and updates at the same count (new message) always land
+        if total == progress["total"] and current < total and 0 < current - progress["current"] < max(1, total // 100):
+            return
+        
+        # Mutate in place; updated_at stays a datetime and is formatted on serialization
+        progress["current"] = current
+        progress["total"] = total
+        progress["percentage"] = round(current / total * 100, 2) if total > 0 else 0.0
+        progress["message"] = message
+        progress["updated_at"] = datetime.now()
+    
+    async def update_job_metadata(self, job_id: str, **metadata: Any) -> None:
+        """Merge values into job metadata."""
+        if job_id not in self._jobs:
+            return
+        
+        self._jobs[job_id]["metadata"].update(metadata)
     
     async def complete_job(
         self,
@@ -101,17 +162,17 @@ class JobService:
         summary: EvaluationSummary
     ) -> None:
         """Mark job as completed with results."""
-        async with self._job_lock:
-            if job_id not in self._jobs:
-                raise ValueError(f"Job {job_id} not found")
-            
-            job = self._jobs[job_id]
-            job["status"] = JobStatus.COMPLETED
-            job["completed_at"] = datetime.now()
-            job["results"] = [result.dict() for result in results]  # Serialize for storage
-            job["summary"] = summary.dict()
-            job["progress"]["current"] = job["progress"]["total"]
-            job["progress"]["percentage"] = 100.0
+        if job_id not in self._jobs:
+            raise ValueError(f"Job {job_id} not found")
+        
+        job = self._jobs[job_id]
+        self._set_status(job, JobStatus.COMPLETED)
+        self._mark_completed(job)
+        # Already validated, so keep the objects themselves
+        job["results"] = results
+        job["summary"] = summary
+        job["progress"]["current"] = job["progress"]["total"]
+        job["progress"]["percentage"] = 100.0
     
     async def fail_job(self, job_id: str, error: str) -> None:
         """Mark job as failed with error."""
@@ -119,23 +180,14 @@ class JobService:
     
     async def get_job(self, job_id: str) -> Optional[AsyncEvaluationResponse]:
         """Get job by ID."""
-        async with self._job_lock:
-            if job_id not in self._jobs:
-                return None
-            
-            job_data = self._jobs[job_id].copy()
-        
-        # Convert stored results back to objects if they exist
-        results = None
-        summary = None
-        
-        if job_data["results"]:
-            results = [TestCaseResult(**result_data) for result_data in job_data["results"]]
+        if job_id not in self._jobs:
+            return None
         
-        if job_data["summary"]:
-            summary = EvaluationSummary(**job_data["summary"])
+        job_data = self._jobs[job_id]
         
-        return AsyncEvaluationResponse(
+        # Stored values were validated on the way in, so skip revalidation;
+        # progress is copied since it's updated in place
+        return AsyncEvaluationResponse.model_construct(
             job_id=job_data["job_id"],
             status=job_data["status"],
             created_at=job_data["created_at"],
@@ -143,10 +195,10 @@ class JobService:
             completed_at=job_data["completed_at"],
             job_name=job_data["job_name"],
             tags=job_data["tags"],
-            results=results,
-            summary=summary,
+            results=job_data["results"],
+            summary=job_data["summary"],
             error=job_data["error"],
-            progress=job_data["progress"],
+            progress=dict(job_data["progress"]),
         )
     
     async def list_jobs(
@@ -157,29 +209,40 @@ class JobService:
         tag_filter: Optional[str] = None
     ) -> JobListResponse:
         """List jobs with pagination and filtering."""
-        async with self._job_lock:
-            jobs = list(self._jobs.values())
-        
-        # Apply filters
-        if status_filter:
-            jobs = [job for job in jobs if job["status"] == status_filter]
-        
-        if tag_filter:
-            jobs = [job for job in jobs if tag_filter in job.get("tags", [])]
-        
-        # Sort by creation time (newest first)
-        jobs.sort(key=lambda x: x["created_at"], reverse=True)
-        
-        # Apply pagination
-        total = len(jobs)
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        page_jobs = jobs[start_idx:end_idx]
+        if status_filter and tag_filter:
+            # Walk the smaller index newest first, keeping keys also in the other
+            index, other = sorted(
+                (self._by_status.get(status_filter, SortedSet()), self._by_tag.get(tag_filter, SortedSet())),
+                key=len
+            )
+            start_idx = (page - 1) * page_size
+            total = 0
+            page_jobs = []
+            for key in reversed(index):
+                if key not in other:
+                    continue
+                if start_idx <= total < start_idx + page_size:
+                    page_jobs.append(self._jobs[key[1]])
+                total += 1
+        else:
+            # Pick the precomputed index matching the filter
+            if status_filter:
+                index = self._by_status.get(status_filter, SortedSet())
+            elif tag_filter:
+                index = self._by_tag.get(tag_filter, SortedSet())
+            else:
+                index = self._by_created
+            
+            # Indices are oldest first, so pages are sliced from the end (newest first)
+            total = len(index)
+            end_idx = max(total - (page - 1) * page_size, 0)
+            start_idx = max(end_idx - page_size, 0)
+            page_jobs = [self._jobs[job_id] for _, job_id in reversed(index[start_idx:end_idx])]
         
         # Convert to response objects
         job_responses = []
         for job_data in page_jobs:
-            job_response = AsyncEvaluationResponse(
+            job_response = AsyncEvaluationResponse.model_construct(
                 job_id=job_data["job_id"],
                 status=job_data["status"],
                 created_at=job_data["created_at"],
@@ -190,11 +253,11 @@ class JobService:
                 results=None,  # Don't include full results in list view
                 summary=None,  # Don't include full summary in list view
                 error=job_data["error"],
-                progress=job_data["progress"],
+                progress=dict(job_data["progress"]),
             )
             job_responses.append(job_response)
         
-        return JobListResponse(
+        return JobListResponse.model_construct(
             jobs=job_responses,
             total=total,
             page=page,
@@ -203,40 +266,34 @@ class JobService:
     
     async def delete_job(self, job_id: str) -> bool:
         """Delete a job."""
-        async with self._job_lock:
-            if job_id in self._jobs:
-                del self._jobs[job_id]
-                return True
-            return False
+        if job_id in self._jobs:
+            self._remove_job(job_id)
+            return True
+        return False
     
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job."""
-        async with self._job_lock:
-            if job_id not in self._jobs:
-                return False
-            
-            job = self._jobs[job_id]
-            if job["status"] in [JobStatus.PENDING, JobStatus.RUNNING]:
-                job["status"] = JobStatus.CANCELLED
-                job["completed_at"] = datetime.now()
-                return True
-            
+        if job_id not in self._jobs:
             return False
+        
+        job = self._jobs[job_id]
+        if job["status"] in [JobStatus.PENDING, JobStatus.RUNNING]:
+            self._set_status(job, JobStatus.CANCELLED)
+            self._mark_completed(job)
+            return True
+        
+        return False
     
     async def cleanup_old_jobs(self, max_age_days: int = 7) -> int:
         """Clean up old completed/failed jobs."""
         cutoff_date = datetime.now() - timedelta(days=max_age_days)
         deleted_count = 0
         
-        async with self._job_lock:
-            jobs_to_delete = []
-            for job_id, job_data in self._jobs.items():
-                if (job_data["status"] in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED] and
-                    job_data["completed_at"] and job_data["completed_at"] < cutoff_date):
-                    jobs_to_delete.append(job_id)
-            
-            for job_id in jobs_to_delete:
-                del self._jobs[job_id]
+        # Only the prefix of the completion index older than the cutoff is visited
+        expired = list(self._by_completed.islice(0, self._by_completed.bisect_left((cutoff_date, ""))))
+        for _, job_id in expired:
+            if self._jobs[job_id]["status"] in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
+                self._remove_job(job_id)
                 deleted_count += 1
         
         return deleted_count
@@ -0,0 +1,62 @@
+import asyncio
+
+from app.models import LLMTestCaseRequest, MetricResult, TestCaseResult
+from app.models import BiasMetricRequest
+from app.services.eval_cache import EvalCache
+
+
+class FakeService:
+    """Stands in for DeepEvalService, counting forwarded test cases."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def evaluate_results(self, test_case_requests, metric_requests, max_concurrent=10):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return [
+            TestCaseResult(
+                test_case=tc,
+                metrics=[MetricResult(metric_type="bias", score=1.0, threshold=0.5, success=True)],
+                overall_success=True,
+            )
+            for tc in test_case_requests
+        ]
+
+    def _calculate_summary(self, results, execution_time):
+        return None
+
+
+TEST_CASE = LLMTestCaseRequest(input="question", actual_output="answer")
+METRICS = [BiasMetricRequest(metric_type="bias")]
+
+
+def test_repeated_evaluation_is_served_from_cache():
+    async def run():
+        service = FakeService()
+        cache = EvalCache(service)
+        first = await cache.evaluate_single(TEST_CASE, METRICS)
+        second = await cache.evaluate_single(TEST_CASE, METRICS)
+        return service.calls, first is second
+
+    assert asyncio.run(run()) == (1, True)
+
+
+def test_cancelled_caller_releases_in_flight_keys():
+    async def run():
+        service = FakeService()
+        cache = EvalCache(service)
+
+        # Cancel before the miss evaluation gets to run
+        task = asyncio.ensure_future(cache.evaluate_results([TEST_CASE], METRICS))
+        asyncio.get_running_loop().call_soon(task.cancel)
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        leaked = len(cache._in_flight)
+        result = await asyncio.wait_for(cache.evaluate_single(TEST_CASE, METRICS), timeout=1)
+        return leaked, result.overall_success
+
+    assert asyncio.run(run()) == (0, True)
@@ -0,0 +1,24 @@
+import asyncio
+
+from app.api import evaluation
+from app.models import EvaluationRequest, JobStatus
+
+
+def test_async_single_evaluation_failure_fails_job(monkeypatch):
+    def raise_error(test_case_request):
+        raise ValueError("bad test case")
+
+    monkeypatch.setattr(evaluation.deepeval_service, "create_test_case", raise_error)
+    request = EvaluationRequest(
+        test_case={"input": "question", "actual_output": "answer"},
+        metrics=[{"metric_type": "bias"}],
+    )
+
+    async def run():
+        job = await evaluation.job_service.create_job(job_name="failing")
+        await evaluation._run_async_single_evaluation(job.job_id, request)
+        return await evaluation.job_service.get_job(job.job_id)
+
+    job = asyncio.run(run())
+    assert job.status == JobStatus.FAILED
+    assert job.error == "bad test case"